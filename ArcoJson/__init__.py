@@ -5,7 +5,7 @@ This library provides comprehensive tools for converting JSON data to CSV format
 with advanced features like nested JSON handling, data validation, and customizable output.
 """
 
-from .converter import JSONConverter
+from .converter import JSONConverter, ConversionPlan
 from .validator import DataValidator
 from .utils import flatten_json, detect_delimiter
 from .exceptions import (
@@ -20,6 +20,7 @@ __author__ = "Your Name"
 __email__ = "your.email@example.com"
 __all__ = [
     "JSONConverter",
+    "ConversionPlan",
     "DataValidator",
     "flatten_json",
     "detect_delimiter",
@@ -5,14 +5,110 @@ This module provides the core JSONConverter class with methods for converting
 JSON data to CSV format with various options and configurations.
 """
 
+import io
+import os
+import re
+import sys
 import json
 import csv
-from typing import List, Dict, Any, Optional, Union
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, repeat
+from operator import itemgetter
+from dataclasses import dataclass
+from typing import (
+    List, Dict, Any, Callable, Iterable, Optional, Sequence, Tuple, Union
+)
 from pathlib import Path
-from .exceptions import ConversionError, FileNotFoundError as CustomFileNotFoundError
-from .utils import flatten_json, detect_delimiter
+from .exceptions import (
+    ConversionError,
+    ValidationError,
+    FileNotFoundError as CustomFileNotFoundError
+)
+from .utils import _JSON_SCALAR_TYPES, flatten_json, detect_delimiter
 from .validator import DataValidator
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
+_UTF8_ENCODINGS = {'utf-8', 'utf8', 'utf_8'}
+
+# Runs of 20+ digits may be integers wider than 64 bits, which orjson would
+# turn into floats; such input is parsed with the stdlib json module
+_WIDE_INT_PATTERN = re.compile(rb'\d{20}')
+
+# Buffer size for CSV output files; larger than the default to cut down on
+# write() calls for big outputs
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Maximum number of schema plans kept per converter
+_MAX_PLANS = 64
+
+# Number of upcoming batch input files the OS is asked to read ahead, and
+# how much of each file (so the readahead stays bounded in bytes too)
+_PREFETCH_WINDOW = 8
+_PREFETCH_BYTES = 4 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class ConversionPlan:
+    """
+    Precomputed conversion settings for rows sharing one set of keys.
+    
+    Attributes:
+        headers (Tuple[str, ...]): Ordered CSV headers
+        getter (Optional[Callable]): ``itemgetter`` for the headers, or None
+            when there are no headers
+    """
+    
+    headers: Tuple[str, ...]
+    getter: Optional[Callable[[Dict], Any]]
+
+
+def _intern_header(header: Any) -> Any:
+    """Intern string headers so repeated schemas share one copy of each."""
+    return sys.intern(header) if type(header) is str else header
+
+
+def _prefetch_file(file_path: str) -> None:
+    """Ask the OS to start reading the start of a file into the page cache.
+    
+    Uses posix_fadvise(WILLNEED) on the first ``_PREFETCH_BYTES`` where
+    available (Linux and most Unixes); it is a hint only and does nothing on
+    other platforms or on error.
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, _PREFETCH_BYTES, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _convert_file(
+    converter_cls: type,
+    config: Dict[str, Any],
+    input_file: str,
+    output_file: str,
+    params: Dict[str, Any]
+) -> None:
+    """Convert a single file in a worker process (module level for pickling)."""
+    converter = converter_cls(**config)
+    converter.convert_to_csv(data=input_file, output_file=output_file, **params)
+
 
 class JSONConverter:
     """
@@ -39,6 +135,10 @@ class JSONConverter:
             **kwargs: Optional configuration parameters
                 - validate (bool): Enable data validation (default: True)
                 - strict_mode (bool): Enable strict validation (default: False)
+                - stream_threshold (int): File size in bytes from which JSON
+                  file input written to an output file may be converted with
+                  convert_stream (see convert_to_csv); None disables it
+                  (default: 64 MiB)
         
         Example:
             >>> converter = JSONConverter(validate=True, strict_mode=False)
@@ -46,6 +146,8 @@ class JSONConverter:
         self.validator = DataValidator()
         self.validate = kwargs.get('validate', True)
         self.strict_mode = kwargs.get('strict_mode', False)
+        self.stream_threshold = kwargs.get('stream_threshold', 64 * 1024 * 1024)
+        self._plans: Dict[frozenset, ConversionPlan] = {}
     
     def convert_to_csv(self, **kwargs) -> Optional[str]:
         """
@@ -54,6 +156,12 @@ class JSONConverter:
         This is the main conversion method that handles various input types
         and converts them to CSV format with customizable options.
         
+        A JSON array file of at least ``stream_threshold`` bytes written to
+        ``output_file`` is streamed with convert_stream (if ``ijson`` is
+        installed) only when that cannot change the columns: when
+        ``custom_headers`` is given, or in strict mode with
+        ``flatten_nested=False``. All other input is loaded into memory.
+        
         Args:
             **kwargs: Conversion parameters
                 - data (Union[List[Dict], Dict, str]): JSON data or file path
@@ -63,7 +171,8 @@ class JSONConverter:
                 - max_depth (int): Maximum depth for flattening (default: 10)
                 - encoding (str): File encoding (default: 'utf-8')
                 - include_index (bool): Include row index (default: False)
-                - custom_headers (List[str]): Custom column headers (optional)
+                - custom_headers (List[str]): Custom column headers (optional);
+                  every key of the (flattened) data must be among them
         
         Returns:
             Optional[str]: CSV string if output_file not specified, None otherwise
@@ -95,24 +204,65 @@ class JSONConverter:
         custom_headers = kwargs.get('custom_headers')
         
         try:
-            # Load data if it's a file path
+            # Load data if it's a file path; large files are streamed instead
+            # when that gives the same columns as loading them (fixed custom
+            # headers, or strict mode without flattening)
             if isinstance(data, str):
+                same_columns = custom_headers or (
+                    self.validate and self.strict_mode and not flatten_nested
+                )
+                if (output_file and same_columns
+                        and self._should_stream(data, encoding)):
+                    try:
+                        self._stream_csv_file(
+                            input_file=data,
+                            output_file=output_file,
+                            delimiter=delimiter,
+                            flatten_nested=flatten_nested,
+                            max_depth=max_depth,
+                            encoding=encoding,
+                            include_index=include_index,
+                            custom_headers=custom_headers
+                        )
+                        return None
+                    except ijson.JSONError:
+                        # ijson rejects some input json accepts (e.g. integers
+                        # beyond 64 bits); fall back to loading the file
+                        pass
                 data = self.load_json_file(file_path=data, encoding=encoding)
             
             # Ensure data is a list
             if isinstance(data, dict):
                 data = [data]
             
-            # Validate data
+            # Validate data; strict mode guarantees consistent keys, which
+            # still hold afterwards as long as no row gets flattened
+            keys_validated = False
             if self.validate:
                 self.validator.validate_data(data=data, strict=self.strict_mode)
+                keys_validated = self.strict_mode
             
-            # Flatten nested JSON if required
+            # Flatten nested JSON if required; rows holding only scalar values
+            # are already flat and are passed through as they are
             if flatten_nested:
-                data = [flatten_json(item, max_depth=max_depth) for item in data]
+                flattened = [self._flatten_item(item, max_depth) for item in data]
+                if keys_validated and any(
+                    new is not old for new, old in zip(flattened, data)
+                ):
+                    keys_validated = False
+                data = flattened
             
-            # Get headers
-            headers = custom_headers if custom_headers else self._extract_headers(data)
+            # Get headers; rows sharing one key set reuse that schema's plan
+            plan = None
+            if custom_headers:
+                headers = [_intern_header(h) for h in custom_headers]
+                self._check_fields(data, set(headers))
+            elif keys_validated or self._has_uniform_keys(data):
+                plan = self._get_plan(data[0].keys())
+                headers = list(plan.headers)
+            else:
+                headers = self._extract_headers(data)
+            getter = plan.getter if plan else None
             
             if include_index:
                 headers = ['index'] + headers
@@ -125,7 +275,8 @@ class JSONConverter:
                     output_file=output_file,
                     delimiter=delimiter,
                     encoding=encoding,
-                    include_index=include_index
+                    include_index=include_index,
+                    getter=getter
                 )
                 return None
             else:
@@ -133,7 +284,8 @@ class JSONConverter:
                     data=data,
                     headers=headers,
                     delimiter=delimiter,
-                    include_index=include_index
+                    include_index=include_index,
+                    getter=getter
                 )
         
         except Exception as e:
@@ -143,6 +295,16 @@ class JSONConverter:
         """
         Load JSON data from a file.
         
+        The whole file is read into memory in one call and parsed from the
+        raw bytes (with orjson when installed and the input is UTF-8), so
+        peak memory is roughly the file size plus the parsed data. For very
+        large files use convert_stream.
+        
+        Input that may hold integers wider than 64 bits (which orjson would
+        turn into floats) and input orjson rejects but the stdlib json module
+        accepts (e.g. ``NaN`` or ``Infinity``) is parsed with json, so the
+        result never depends on whether orjson is installed.
+        
         Args:
             **kwargs: Loading parameters
                 - file_path (str): Path to JSON file
@@ -162,13 +324,19 @@ class JSONConverter:
         file_path = kwargs.get('file_path')
         encoding = kwargs.get('encoding', 'utf-8')
         
-        path = Path(file_path)
-        if not path.exists():
+        try:
+            raw = Path(file_path).read_bytes()
+        except FileNotFoundError:
             raise CustomFileNotFoundError(f"File not found: {file_path}")
         
         try:
-            with open(file_path, 'r', encoding=encoding) as f:
-                return json.load(f)
+            if (orjson is not None and encoding.lower() in _UTF8_ENCODINGS
+                    and not _WIDE_INT_PATTERN.search(raw)):
+                try:
+                    return orjson.loads(raw)
+                except orjson.JSONDecodeError:
+                    pass
+            return json.loads(raw.decode(encoding))
         except json.JSONDecodeError as e:
             raise ConversionError(f"Invalid JSON file: {str(e)}")
     
@@ -180,6 +348,9 @@ class JSONConverter:
             **kwargs: Batch conversion parameters
                 - input_files (List[str]): List of input JSON file paths
                 - output_dir (str): Output directory for CSV files
+                - workers (int): Number of worker processes; files are
+                  converted in parallel when greater than 1, None uses one
+                  per CPU (default: 1)
                 - **other: Additional parameters for convert_to_csv
         
         Raises:
@@ -190,27 +361,152 @@ class JSONConverter:
             >>> converter.convert_batch(
             ...     input_files=["file1.json", "file2.json"],
             ...     output_dir="output/",
-            ...     flatten_nested=True
+            ...     flatten_nested=True,
+            ...     workers=4
             ... )
         """
         input_files = kwargs.get('input_files', [])
         output_dir = kwargs.get('output_dir', '.')
+        workers = kwargs.get('workers', 1)
         
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         
         conversion_params = {k: v for k, v in kwargs.items() 
-                           if k not in ['input_files', 'output_dir']}
+                           if k not in ['input_files', 'output_dir', 'workers']}
+        
+        output_files = [
+            str(output_path / f"{Path(input_file).stem}.csv")
+            for input_file in input_files
+        ]
+        
+        if workers is None:
+            workers = os.cpu_count() or 1
+        
+        if workers <= 1 or len(input_files) <= 1:
+            # Keep the next few files being read by the OS in the background
+            # while the current one is converted
+            for input_file in input_files[:_PREFETCH_WINDOW]:
+                _prefetch_file(input_file)
+            
+            for idx, (input_file, output_file) in enumerate(
+                zip(input_files, output_files)
+            ):
+                if idx + _PREFETCH_WINDOW < len(input_files):
+                    _prefetch_file(input_files[idx + _PREFETCH_WINDOW])
+                self.convert_to_csv(
+                    data=input_file,
+                    output_file=output_file,
+                    **conversion_params
+                )
+            return
+        
+        # Each worker builds its own converter with the same settings
+        config = {
+            'validate': self.validate,
+            'strict_mode': self.strict_mode,
+            'stream_threshold': self.stream_threshold
+        }
+        chunksize = max(1, len(input_files) // (4 * workers))
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(
+                _convert_file,
+                repeat(type(self)),
+                repeat(config),
+                input_files,
+                output_files,
+                repeat(conversion_params),
+                chunksize=chunksize
+            ))
+    
+    def convert_stream(self, **kwargs) -> None:
+        """
+        Convert a large JSON file to CSV without loading it all into memory.
+        
+        The input must hold a top-level JSON array. Items are parsed one at a
+        time with ``ijson`` and written out in chunks, so memory use depends on
+        the chunk size rather than the file size. Headers are taken from the
+        first item (or ``custom_headers``); keys that only appear in later
+        (flattened) items are not written and trigger a warning. Strict mode
+        compares each item's raw keys with the first item's, like
+        DataValidator. Without ``ijson`` installed, for non UTF-8 input, or
+        when ``ijson`` rejects the file (e.g. integers beyond 64 bits), the
+        file is loaded and converted with convert_to_csv instead.
+        
+        Args:
+            **kwargs: Stream conversion parameters
+                - input_file (str): Input JSON file path
+                - output_file (str): Output CSV file path
+                - chunk_size (int): Rows written per batch (default: 10000)
+                - **other: Same options as convert_to_csv
+        
+        Raises:
+            FileNotFoundError: If the input file doesn't exist
+            ConversionError: If conversion fails
+            
+        Example:
+            >>> converter = JSONConverter()
+            >>> converter.convert_stream(
+            ...     input_file="large.json",
+            ...     output_file="large.csv",
+            ...     chunk_size=5000
+            ... )
+        """
+        input_file = kwargs.get('input_file')
+        encoding = kwargs.get('encoding', 'utf-8')
+        
+        if not Path(input_file).exists():
+            raise CustomFileNotFoundError(f"File not found: {input_file}")
+        
+        # ijson parses UTF-8 arrays item by item; anything else (including a
+        # file holding a single object) goes through convert_to_csv
+        if (ijson is None or encoding.lower() not in _UTF8_ENCODINGS
+                or not self._is_json_array(input_file)):
+            conversion_params = {k: v for k, v in kwargs.items()
+                               if k not in ['input_file', 'chunk_size']}
+            self.convert_to_csv(data=input_file, **conversion_params)
+            return
+        
+        try:
+            self._stream_csv_file(**kwargs)
+            return
+        except ijson.JSONError:
+            # ijson rejects some input json accepts (e.g. integers beyond
+            # 64 bits); convert the fully loaded file instead
+            pass
+        except Exception as e:
+            raise ConversionError(f"Stream conversion failed: {str(e)}")
+        
+        conversion_params = {k: v for k, v in kwargs.items()
+                           if k not in ['input_file', 'chunk_size']}
+        data = self.load_json_file(file_path=input_file, encoding=encoding)
+        self.convert_to_csv(data=data, **conversion_params)
+    
+    def prepare(self, **kwargs) -> ConversionPlan:
+        """
+        Prepare and cache the conversion plan for a row schema.
+        
+        Rows with the same set of keys share one plan holding the ordered
+        headers and a value getter. convert_to_csv and convert_batch look plans
+        up automatically; calling prepare up front just builds one ahead of
+        the first conversion.
+        
+        Args:
+            **kwargs: Preparation parameters
+                - sample_row (Dict): A row with the schema to prepare
         
-        for input_file in input_files:
-            input_path = Path(input_file)
-            output_file = output_path / f"{input_path.stem}.csv"
+        Returns:
+            ConversionPlan: The cached plan for the row's keys
             
-            self.convert_to_csv(
-                data=input_file,
-                output_file=str(output_file),
-                **conversion_params
-            )
+        Example:
+            >>> converter = JSONConverter()
+            >>> plan = converter.prepare(sample_row={"name": "John", "age": 30})
+            >>> plan.headers
+            ('age', 'name')
+        """
+        sample_row = kwargs.get('sample_row', {})
+        return self._get_plan(sample_row.keys())
     
     def preview_conversion(self, **kwargs) -> str:
         """
@@ -233,10 +529,12 @@ class JSONConverter:
         """
         rows = kwargs.get('rows', 5)
         data = kwargs.get('data')
+        encoding = kwargs.get('encoding', 'utf-8')
         
-        # Load and process data
+        # Load and process data; files are only read up to the previewed rows
+        # when they can be parsed incrementally
         if isinstance(data, str):
-            data = self.load_json_file(file_path=data)
+            data = self._load_json_head(data, rows, encoding)
         
         if isinstance(data, dict):
             data = [data]
@@ -250,12 +548,230 @@ class JSONConverter:
         
         return self.convert_to_csv(data=preview_data, **conversion_params)
     
+    def _load_json_head(
+        self, file_path: str, rows: int, encoding: str
+    ) -> Union[List[Dict], Dict]:
+        """Load the first items of a JSON file, or the whole file if needed."""
+        if (ijson is None or encoding.lower() not in _UTF8_ENCODINGS
+                or not self._is_json_array(file_path)):
+            return self.load_json_file(file_path=file_path, encoding=encoding)
+        
+        try:
+            with open(file_path, 'rb') as f:
+                items = ijson.items(f, 'item', use_float=True)
+                return list(islice(items, rows))
+        except ijson.JSONError:
+            # ijson rejects some input json accepts (e.g. integers beyond
+            # 64 bits, NaN); load the whole file instead
+            return self.load_json_file(file_path=file_path, encoding=encoding)
+    
+    def _is_json_array(self, file_path: str) -> bool:
+        """Check whether a JSON file holds a top-level array."""
+        try:
+            with open(file_path, 'rb') as f:
+                return f.read(64).lstrip().startswith(b'[')
+        except OSError:
+            return False
+    
+    def _should_stream(self, file_path: str, encoding: str) -> bool:
+        """Check whether a JSON file is large enough to be streamed."""
+        if ijson is None or self.stream_threshold is None:
+            return False
+        if encoding.lower() not in _UTF8_ENCODINGS:
+            return False
+        path = Path(file_path)
+        if not path.is_file() or path.stat().st_size < self.stream_threshold:
+            return False
+        # Only a top-level array can be streamed item by item
+        return self._is_json_array(file_path)
+    
+    def _stream_csv_file(self, **kwargs) -> None:
+        """Stream items from a JSON array file into a CSV file."""
+        input_file = kwargs['input_file']
+        output_file = kwargs['output_file']
+        delimiter = kwargs.get('delimiter', ',')
+        flatten_nested = kwargs.get('flatten_nested', True)
+        max_depth = kwargs.get('max_depth', 10)
+        encoding = kwargs.get('encoding', 'utf-8')
+        include_index = kwargs.get('include_index', False)
+        custom_headers = kwargs.get('custom_headers')
+        chunk_size = kwargs.get('chunk_size', 10000)
+        
+        strict = self.validate and self.strict_mode
+        first_keys = None
+        fields = None
+        field_set = None
+        drift_warned = False
+        batch = []
+        
+        # Write to a temporary file next to the output and move it into place
+        # only once every item converted, so errors never leave a partial CSV
+        output_path = Path(output_file)
+        tmp_path = output_path.with_name(
+            f".{output_path.name}.{os.getpid()}.tmp"
+        )
+        
+        try:
+            with open(input_file, 'rb') as src, \
+                    open(tmp_path, 'w', newline='', encoding=encoding,
+                         buffering=_WRITE_BUFFER_SIZE) as f:
+                writer = self._csv_writer(f, delimiter)
+                
+                for idx, item in enumerate(ijson.items(src, 'item', use_float=True)):
+                    if self.validate and not isinstance(item, dict):
+                        raise ValidationError("All items must be dictionaries")
+                    
+                    # Strict mode compares the raw keys, as DataValidator does
+                    if strict:
+                        if first_keys is None:
+                            first_keys = set(item.keys())
+                        elif item.keys() != first_keys:
+                            raise ValidationError(
+                                f"Item at index {idx} has different keys. "
+                                f"Expected: {first_keys}, Got: {set(item.keys())}"
+                            )
+                    
+                    if flatten_nested:
+                        item = self._flatten_item(item, max_depth)
+                    
+                    if fields is None:
+                        if custom_headers:
+                            fields = [_intern_header(h) for h in custom_headers]
+                        else:
+                            fields = list(self._get_plan(item.keys()).headers)
+                        field_set = set(fields)
+                        writer.writerow(['index'] + fields if include_index else fields)
+                    
+                    if custom_headers:
+                        self._check_fields((item,), field_set)
+                    elif (not drift_warned
+                            and item.keys() != field_set):
+                        warnings.warn(
+                            f"Item at index {idx} has different keys than the "
+                            f"first item; only the first item's keys are written"
+                        )
+                        drift_warned = True
+                    
+                    row = [item.get(h, '') for h in fields]
+                    if include_index:
+                        row.insert(0, idx)
+                    batch.append(row)
+                    
+                    if len(batch) >= chunk_size:
+                        writer.writerows(batch)
+                        batch.clear()
+                
+                writer.writerows(batch)
+            
+            if fields is None and self.validate:
+                raise ValidationError("Data cannot be empty")
+            
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            if tmp_path.exists():
+                tmp_path.unlink()
+            raise
+    
+    def _flatten_item(self, item: Dict, max_depth: int) -> Dict:
+        """Flatten an item, passing through items that are already flat."""
+        if max_depth > 0 and not self._is_nested(item):
+            return item
+        return flatten_json(item, max_depth=max_depth)
+    
+    def _is_nested(self, item: Dict) -> bool:
+        """Check whether an item has dict or list values to flatten."""
+        for v in item.values():
+            value_type = type(v)
+            if value_type is dict or value_type is list:
+                return True
+            # Only unknown types (e.g. OrderedDict) need an isinstance() check
+            if (value_type not in _JSON_SCALAR_TYPES
+                    and isinstance(v, (dict, list))):
+                return True
+        return False
+    
+    def _check_fields(self, data: List[Dict], field_set: set) -> None:
+        """Reject items with keys outside the custom headers, as DictWriter did."""
+        for item in data:
+            if not field_set.issuperset(item.keys()):
+                extra = [k for k in item if k not in field_set]
+                raise ValueError(
+                    "dict contains fields not in fieldnames: "
+                    + ", ".join(repr(k) for k in extra)
+                )
+    
+    def _has_uniform_keys(self, data: List[Dict]) -> bool:
+        """Check whether all items share the same set of keys."""
+        if not data:
+            return False
+        first_keys = data[0].keys()
+        return all(item.keys() == first_keys for item in data)
+    
+    def _get_plan(self, keys: Iterable[Any]) -> ConversionPlan:
+        """Return the cached plan for a set of keys, building it if needed."""
+        key = frozenset(keys)
+        plan = self._plans.pop(key, None)
+        if plan is None:
+            headers = tuple(_intern_header(k) for k in sorted(key))
+            getter = itemgetter(*headers) if headers else None
+            plan = ConversionPlan(headers=headers, getter=getter)
+            if len(self._plans) >= _MAX_PLANS:
+                # Drop the least recently used plan to keep the cache bounded
+                del self._plans[next(iter(self._plans))]
+        # (Re)insert at the end so the dict stays in least-recently-used order
+        self._plans[key] = plan
+        return plan
+    
     def _extract_headers(self, data: List[Dict]) -> List[str]:
         """Extract all unique headers from data."""
         headers = set()
         for item in data:
             headers.update(item.keys())
-        return sorted(list(headers))
+        return [_intern_header(h) for h in sorted(headers)]
+    
+    def _build_rows(
+        self,
+        data: List[Dict],
+        headers: List[str],
+        include_index: bool,
+        getter: Optional[Callable[[Dict], Any]] = None
+    ) -> Iterable[Sequence[Any]]:
+        """Build row values in header order.
+        
+        When every row is known to contain every header, values are fetched
+        with the plan's ``itemgetter`` in a single call per row. Otherwise they
+        are gathered one column at a time with ``dict.get`` and zipped back
+        into rows.
+        """
+        fields = headers[1:] if include_index else headers
+        
+        if getter is not None:
+            if len(fields) == 1:
+                # itemgetter returns a bare value for a single key
+                rows = zip(map(getter, data))
+            else:
+                rows = map(getter, data)
+            if include_index:
+                return ((idx,) + values for idx, values in enumerate(rows))
+            return rows
+        
+        columns: List[Sequence[Any]] = [
+            [row.get(h, '') for row in data] for h in fields
+        ]
+        if include_index:
+            columns.insert(0, range(len(data)))
+        if not columns:
+            return [()] * len(data)
+        return zip(*columns)
+    
+    def _csv_writer(self, f: Any, delimiter: str) -> Any:
+        """Create the CSV writer used for all output.
+        
+        Quoting and escaping are left entirely to the C-implemented csv
+        module, which only quotes cells containing the delimiter, quotes or
+        line breaks.
+        """
+        return csv.writer(f, delimiter=delimiter, quoting=csv.QUOTE_MINIMAL)
     
     def _write_csv_file(self, **kwargs) -> None:
         """Write data to CSV file."""
@@ -265,32 +781,32 @@ class JSONConverter:
         delimiter = kwargs['delimiter']
         encoding = kwargs['encoding']
         include_index = kwargs['include_index']
+        getter = kwargs.get('getter')
         
-        with open(output_file, 'w', newline='', encoding=encoding) as f:
-            writer = csv.DictWriter(f, fieldnames=headers, delimiter=delimiter)
-            writer.writeheader()
-            
-            for idx, row in enumerate(data):
-                if include_index:
-                    row['index'] = idx
-                writer.writerow(row)
+        rows = self._build_rows(data, headers, include_index, getter)
+        
+        with open(output_file, 'w', newline='', encoding=encoding,
+                  buffering=_WRITE_BUFFER_SIZE) as f:
+            writer = self._csv_writer(f, delimiter)
+            writer.writerow(headers)
+            writer.writerows(rows)
     
     def _generate_csv_string(self, **kwargs) -> str:
         """Generate CSV string from data."""
-        import io
-        
         data = kwargs['data']
         headers = kwargs['headers']
         delimiter = kwargs['delimiter']
         include_index = kwargs['include_index']
+        getter = kwargs.get('getter')
         
-        output = io.StringIO()
-        writer = csv.DictWriter(output, fieldnames=headers, delimiter=delimiter)
-        writer.writeheader()
+        rows = self._build_rows(data, headers, include_index, getter)
         
-        for idx, row in enumerate(data):
-            if include_index:
-                row['index'] = idx
-            writer.writerow(row)
+        # A fresh buffer per call measures as fast as reusing a pooled one
+        # (getvalue() copies either way) and is freed as soon as we return,
+        # instead of pinning the largest output ever produced.
+        output = io.StringIO()
+        writer = self._csv_writer(output, delimiter)
+        writer.writerow(headers)
+        writer.writerows(rows)
         
-        return output.getvalue()
\ No newline at end of file
+        return output.getvalue()
@@ -2,6 +2,10 @@
 
 from typing import Dict, Any
 
+# Leaf types produced by JSON parsers; values of these types never need an
+# isinstance() check for dict/list subclasses
+_JSON_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
 
 def flatten_json(data: Dict[str, Any], **kwargs) -> Dict[str, Any]:
     """
@@ -10,7 +14,7 @@ def flatten_json(data: Dict[str, Any], **kwargs) -> Dict[str, Any]:
     Args:
         data (Dict[str, Any]): Nested JSON data
         **kwargs: Flattening parameters
-            - parent_key (str): Parent key for recursion (default: '')
+            - parent_key (str): Prefix for generated keys (default: '')
             - separator (str): Key separator (default: '.')
             - max_depth (int): Maximum depth to flatten (default: 10)
     
@@ -29,30 +33,40 @@ def flatten_json(data: Dict[str, Any], **kwargs) -> Dict[str, Any]:
     max_depth = kwargs.get('max_depth', 10)
     current_depth = kwargs.get('current_depth', 0)
     
-    items = []
-    
     if current_depth >= max_depth:
         return {parent_key: data}
     
-    for k, v in data.items():
-        new_key = f"{parent_key}{separator}{k}" if parent_key else k
-        
-        if isinstance(v, dict):
-            items.extend(
-                flatten_json(
-                    v,
-                    parent_key=new_key,
-                    separator=separator,
-                    max_depth=max_depth,
-                    current_depth=current_depth + 1
-                ).items()
-            )
-        elif isinstance(v, list):
-            items.append((new_key, str(v)))
+    flat = {}
+    
+    # Walk the structure with an explicit stack holding one frame per open
+    # dict: (key prefix, iterator over its items, depth of its values).
+    # Each key is built once per level and leaves go straight into `flat`;
+    # descending into a child pauses the parent's iterator, which keeps the
+    # original key order.
+    stack = [(parent_key, iter(data.items()), current_depth + 1)]
+    
+    while stack:
+        prefix, items, depth = stack[-1]
+        for k, v in items:
+            key = f"{prefix}{separator}{k}" if prefix else k
+            # Exact type checks are cheaper than isinstance() and cover parser
+            # output; only unknown types (e.g. OrderedDict) use isinstance()
+            value_type = type(v)
+            if (value_type is not dict and value_type is not list
+                    and value_type not in _JSON_SCALAR_TYPES):
+                if isinstance(v, dict):
+                    value_type = dict
+                elif isinstance(v, list):
+                    value_type = list
+            
+            if value_type is dict and depth < max_depth:
+                stack.append((key, iter(v.items()), depth + 1))
+                break
+            flat[key] = str(v) if value_type is list else v
         else:
-            items.append((new_key, v))
+            stack.pop()
     
-    return dict(items)
+    return flat
 
 
 def detect_delimiter(**kwargs) -> str:
@@ -77,13 +91,12 @@ def detect_delimiter(**kwargs) -> str:
     sample = kwargs.get('sample', '')
     candidates = kwargs.get('candidates', [',', ';', '\t', '|'])
     
-    max_count = 0
-    detected = ','
+    if not sample or not candidates:
+        return ','
     
-    for delimiter in candidates:
-        count = sample.count(delimiter)
-        if count > max_count:
-            max_count = count
-            detected = delimiter
+    # str.count scans in C, which beats a single Python-level pass
+    # (e.g. collections.Counter) for the handful of usual candidates.
+    counts = {delimiter: sample.count(delimiter) for delimiter in candidates}
+    detected = max(candidates, key=counts.__getitem__)
     
-    return detected
\ No newline at end of file
+    return detected if counts[detected] > 0 else ','
\ No newline at end of file
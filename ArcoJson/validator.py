@@ -57,10 +57,14 @@ class DataValidator:
         if not data:
             return
         
-        first_keys = set(data[0].keys())
-        for idx, item in enumerate(data[1:], 1):
-            if set(item.keys()) != first_keys:
+        # Compare key views directly (no per-item set), checking the cheap
+        # length first; sets are only built for the error message.
+        first_keys = data[0].keys()
+        key_count = len(first_keys)
+        for idx in range(1, len(data)):
+            item = data[idx]
+            if len(item) != key_count or item.keys() != first_keys:
                 raise ValidationError(
                     f"Item at index {idx} has different keys. "
-                    f"Expected: {first_keys}, Got: {set(item.keys())}"
+                    f"Expected: {set(first_keys)}, Got: {set(item.keys())}"
                 )
\ No newline at end of file
@@ -6,8 +6,14 @@ This file demonstrates complex use cases and advanced features.
 
 from ArcoJson import JSONConverter, DataValidator, flatten_json
 from ArcoJson.exceptions import ValidationError, ConversionError
+from pathlib import Path
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def example_1_batch_conversion():
     """Convert multiple JSON files at once."""
@@ -34,10 +40,12 @@ def example_1_batch_conversion():
         ]
     }
     
-    # Create files
+    # Create files, using orjson when it is installed
     for filename, data in datasets.items():
-        with open(filename, 'w') as f:
-            json.dump(data, f)
+        if orjson is not None:
+            Path(filename).write_bytes(orjson.dumps(data))
+        else:
+            Path(filename).write_text(json.dumps(data), encoding='utf-8')
     
     # Batch convert
     converter = JSONConverter()
@@ -105,6 +105,12 @@ def example_4_from_json_file():
     print("=" * 50)
     
     import json
+    from pathlib import Path
+    
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
     
     # Create sample JSON file
     data = [
@@ -113,8 +119,11 @@ def example_4_from_json_file():
         {"id": 3, "name": "Product C", "price": 20.99}
     ]
     
-    with open("sample_data.json", "w") as f:
-        json.dump(data, f)
+    # Write the whole file in one call, using orjson when it is installed
+    if orjson is not None:
+        Path("sample_data.json").write_bytes(orjson.dumps(data))
+    else:
+        Path("sample_data.json").write_text(json.dumps(data), encoding="utf-8")
     
     # Convert from file
     converter = JSONConverter()
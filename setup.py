@@ -42,6 +42,12 @@ setup(
             "mypy>=1.0.0",
             "sphinx>=6.0.0",
         ],
+        "fast": [
+            "orjson>=3.6.0",
+        ],
+        "stream": [
+            "ijson>=3.1.0",
+        ],
     },
     package_data={
         "ArcoJson": ["py.typed"],
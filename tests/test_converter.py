@@ -1,11 +1,13 @@
 """Tests for JSONConverter class."""
 
 import pytest
+import csv
+import io
 import json
 import tempfile
 import os
 from pathlib import Path
-from ArcoJson import JSONConverter
+from ArcoJson import JSONConverter, ConversionPlan, CustomFileNotFoundError
 from ArcoJson.exceptions import ConversionError, ValidationError
 
 
@@ -69,8 +71,12 @@ class TestJSONConverter:
             output_file = f.name
         
         try:
-            converter.convert_to_csv(data=sample_data, output_file=output_file)
+            result = converter.convert_to_csv(
+                data=sample_data,
+                output_file=output_file
+            )
             
+            assert result is None
             assert os.path.exists(output_file)
             
             with open(output_file, 'r') as f:
@@ -114,6 +120,19 @@ class TestJSONConverter:
         assert "0" in result
         assert "1" in result
     
+    def test_include_index_does_not_modify_data(self, sample_data):
+        """Test that adding a row index leaves the input rows untouched."""
+        converter = JSONConverter()
+        
+        result = converter.convert_to_csv(
+            data=sample_data,
+            flatten_nested=False,
+            include_index=True
+        )
+        
+        assert result.splitlines()[1] == "0,30,NYC,John"
+        assert "index" not in sample_data[0]
+    
     def test_custom_headers(self, converter, sample_data):
         """Test conversion with custom headers."""
         custom_headers = ["full_name", "years", "location"]
@@ -134,6 +153,29 @@ class TestJSONConverter:
         assert "years" in result
         assert "location" in result
     
+    def test_prepare_plan_reused(self, converter, sample_data):
+        """Test that a prepared plan is reused for matching rows."""
+        plan = converter.prepare(sample_row=sample_data[0])
+        
+        assert isinstance(plan, ConversionPlan)
+        assert plan.headers == ("age", "city", "name")
+        assert converter.prepare(sample_row={"city": "LA", "name": "Jane",
+                                             "age": 25}) is plan
+        
+        result = converter.convert_to_csv(data=sample_data)
+        assert result.splitlines()[1] == "30,NYC,John"
+    
+    def test_plan_cache_keeps_recently_used(self, converter, monkeypatch):
+        """Test the plan cache evicts the least recently used schema."""
+        monkeypatch.setattr("ArcoJson.converter._MAX_PLANS", 2)
+        
+        hot = converter.prepare(sample_row={"a": 1})
+        converter.prepare(sample_row={"b": 1})
+        assert converter.prepare(sample_row={"a": 2}) is hot
+        converter.prepare(sample_row={"c": 1})
+        
+        assert converter.prepare(sample_row={"a": 3}) is hot
+    
     def test_load_json_file(self, converter):
         """Test loading JSON from file."""
         data = [{"name": "John", "age": 30}]
@@ -153,6 +195,71 @@ class TestJSONConverter:
             if os.path.exists(json_file):
                 os.remove(json_file)
     
+    def test_load_missing_json_file(self, converter):
+        """Test loading a JSON file that does not exist."""
+        with pytest.raises(CustomFileNotFoundError):
+            converter.load_json_file(file_path="does_not_exist.json")
+    
+    def test_load_json_file_encoding(self, converter):
+        """Test loading a JSON file that is not UTF-8 encoded."""
+        data = [{"name": "José"}]
+        
+        with tempfile.NamedTemporaryFile(
+            mode='w',
+            delete=False,
+            suffix='.json',
+            encoding='latin-1'
+        ) as f:
+            json.dump(data, f, ensure_ascii=False)
+            json_file = f.name
+        
+        try:
+            loaded_data = converter.load_json_file(
+                file_path=json_file,
+                encoding='latin-1'
+            )
+            assert loaded_data == data
+        finally:
+            if os.path.exists(json_file):
+                os.remove(json_file)
+    
+    def test_load_json_file_nan(self, converter):
+        """Test loading JSON with NaN, which only the stdlib parser accepts."""
+        with tempfile.NamedTemporaryFile(
+            mode='w',
+            delete=False,
+            suffix='.json'
+        ) as f:
+            f.write('[{"score": NaN}]')
+            json_file = f.name
+        
+        try:
+            loaded_data = converter.load_json_file(file_path=json_file)
+            assert loaded_data[0]["score"] != loaded_data[0]["score"]
+        finally:
+            if os.path.exists(json_file):
+                os.remove(json_file)
+    
+    def test_load_json_file_wide_integer(self, converter):
+        """Test integers wider than 64 bits keep their exact value."""
+        with tempfile.NamedTemporaryFile(
+            mode='w',
+            delete=False,
+            suffix='.json'
+        ) as f:
+            json.dump([{"id": 2 ** 70}], f)
+            json_file = f.name
+        
+        try:
+            assert converter.load_json_file(file_path=json_file) == [
+                {"id": 2 ** 70}
+            ]
+            result = converter.convert_to_csv(data=json_file)
+            assert result.splitlines() == ["id", str(2 ** 70)]
+        finally:
+            if os.path.exists(json_file):
+                os.remove(json_file)
+    
     def test_preview_conversion(self, converter):
         """Test preview functionality."""
         data = [{"name": f"Person{i}", "age": 20 + i} for i in range(10)]
@@ -163,6 +270,42 @@ class TestJSONConverter:
         lines = preview.strip().split('\n')
         assert len(lines) == 4  # 1 header + 3 data rows
     
+    def test_preview_from_file(self, converter):
+        """Test previewing only the first rows of a JSON file."""
+        data = [{"name": f"Person{i}", "age": 20 + i} for i in range(10)]
+        
+        with tempfile.NamedTemporaryFile(
+            mode='w',
+            delete=False,
+            suffix='.json'
+        ) as f:
+            json.dump(data, f)
+            json_file = f.name
+        
+        try:
+            preview = converter.preview_conversion(data=json_file, rows=2)
+            assert preview.splitlines() == ["age,name", "20,Person0", "21,Person1"]
+        finally:
+            if os.path.exists(json_file):
+                os.remove(json_file)
+    
+    def test_preview_from_file_ijson_fallback(self, converter):
+        """Test previewing a file ijson cannot parse but json can."""
+        with tempfile.NamedTemporaryFile(
+            mode='w',
+            delete=False,
+            suffix='.json'
+        ) as f:
+            f.write('[{"id": 9223372036854775813, "score": NaN}]')
+            json_file = f.name
+        
+        try:
+            preview = converter.preview_conversion(data=json_file, rows=1)
+            assert preview.splitlines() == ["id,score", "9223372036854775813,nan"]
+        finally:
+            if os.path.exists(json_file):
+                os.remove(json_file)
+    
     def test_batch_conversion(self, converter):
         """Test batch file conversion."""
         # Create temporary JSON files
@@ -200,6 +343,296 @@ class TestJSONConverter:
                 csv_file.unlink()
             os.rmdir(output_dir)
     
+    def test_batch_prefetch_window(self, converter, monkeypatch):
+        """Test batch conversion reads ahead a bounded window of files."""
+        events = []
+        
+        def fake_fadvise(fd, offset, length, advice):
+            events.append(("advise", offset, length))
+        
+        def fake_convert(**kwargs):
+            events.append(("convert",))
+        
+        monkeypatch.setattr(os, "posix_fadvise", fake_fadvise, raising=False)
+        monkeypatch.setattr(os, "POSIX_FADV_WILLNEED", 3, raising=False)
+        monkeypatch.setattr(converter, "convert_to_csv", fake_convert)
+        
+        output_dir = tempfile.mkdtemp()
+        temp_files = []
+        
+        try:
+            for i in range(10):
+                json_file = os.path.join(output_dir, f"part{i}.json")
+                with open(json_file, 'w') as f:
+                    json.dump([{"id": i}], f)
+                temp_files.append(json_file)
+            
+            converter.convert_batch(input_files=temp_files, output_dir=output_dir)
+            
+            advise = ("advise", 0, 4 * 1024 * 1024)
+            convert = ("convert",)
+            assert events == (
+                [advise] * 8
+                + [advise, convert, advise, convert]
+                + [convert] * 8
+            )
+        finally:
+            for f in temp_files:
+                os.remove(f)
+            os.rmdir(output_dir)
+    
+    def test_parallel_batch_conversion(self, converter):
+        """Test batch conversion using worker processes."""
+        temp_files = []
+        output_dir = tempfile.mkdtemp()
+        
+        try:
+            for i in range(3):
+                json_file = os.path.join(output_dir, f"part{i}.json")
+                with open(json_file, 'w') as f:
+                    json.dump([{"id": i, "name": f"Item{i}"}], f)
+                temp_files.append(json_file)
+            
+            converter.convert_batch(
+                input_files=temp_files,
+                output_dir=output_dir,
+                workers=2
+            )
+            
+            for i in range(3):
+                with open(os.path.join(output_dir, f"part{i}.csv")) as f:
+                    assert f"Item{i}" in f.read()
+        
+        finally:
+            for f in temp_files:
+                if os.path.exists(f):
+                    os.remove(f)
+            for csv_file in Path(output_dir).glob("*.csv"):
+                csv_file.unlink()
+            os.rmdir(output_dir)
+    
+    def test_convert_stream(self, converter):
+        """Test streaming conversion of a JSON file in chunks."""
+        pytest.importorskip("ijson")
+        data = [{"id": i, "info": {"name": f"Item{i}"}} for i in range(5)]
+        output_dir = tempfile.mkdtemp()
+        json_file = os.path.join(output_dir, "data.json")
+        csv_file = os.path.join(output_dir, "data.csv")
+        
+        try:
+            with open(json_file, 'w') as f:
+                json.dump(data, f)
+            
+            converter.convert_stream(
+                input_file=json_file,
+                output_file=csv_file,
+                chunk_size=2
+            )
+            
+            with open(csv_file, 'r', newline='') as f:
+                lines = f.read().splitlines()
+            assert lines[0] == "id,info.name"
+            assert lines[1:] == [f"{i},Item{i}" for i in range(5)]
+        finally:
+            for path in (json_file, csv_file):
+                if os.path.exists(path):
+                    os.remove(path)
+            os.rmdir(output_dir)
+    
+    def test_convert_stream_single_object(self, converter):
+        """Test streaming a file that holds one object instead of an array."""
+        output_dir = tempfile.mkdtemp()
+        json_file = os.path.join(output_dir, "data.json")
+        csv_file = os.path.join(output_dir, "data.csv")
+        
+        try:
+            with open(json_file, 'w') as f:
+                json.dump({"id": 1, "name": "A"}, f)
+            
+            converter.convert_stream(input_file=json_file, output_file=csv_file)
+            
+            with open(csv_file, 'r', newline='') as f:
+                assert f.read().splitlines() == ["id,name", "1,A"]
+        finally:
+            for path in (json_file, csv_file):
+                if os.path.exists(path):
+                    os.remove(path)
+            os.rmdir(output_dir)
+    
+    def test_custom_headers_reject_extra_keys(self):
+        """Test custom headers must name every data key, streamed or not."""
+        data = [{"id": 1, "name": "A"}, {"id": 2, "extra": True}]
+        converter = JSONConverter()
+        
+        with pytest.raises(ConversionError, match="'extra'"):
+            converter.convert_to_csv(data=data, custom_headers=["id", "name"])
+        
+        pytest.importorskip("ijson")
+        converter = JSONConverter(stream_threshold=0)
+        output_dir = tempfile.mkdtemp()
+        json_file = os.path.join(output_dir, "data.json")
+        csv_file = os.path.join(output_dir, "data.csv")
+        
+        try:
+            with open(json_file, 'w') as f:
+                json.dump(data, f)
+            
+            with pytest.raises(ConversionError, match="'extra'"):
+                converter.convert_to_csv(
+                    data=json_file,
+                    output_file=csv_file,
+                    custom_headers=["id", "name"]
+                )
+            assert not os.path.exists(csv_file)
+        finally:
+            os.remove(json_file)
+            os.rmdir(output_dir)
+    
+    def test_large_file_is_streamed(self):
+        """Test convert_to_csv streams large files given custom headers."""
+        pytest.importorskip("ijson")
+        converter = JSONConverter(stream_threshold=0)
+        data = [{"id": 1, "name": "A"}, {"id": 2, "extra": True}]
+        output_dir = tempfile.mkdtemp()
+        json_file = os.path.join(output_dir, "data.json")
+        csv_file = os.path.join(output_dir, "data.csv")
+        
+        try:
+            with open(json_file, 'w') as f:
+                json.dump(data, f)
+            
+            converter.convert_to_csv(
+                data=json_file,
+                output_file=csv_file,
+                custom_headers=["id", "name", "extra"]
+            )
+            with open(csv_file, 'r', newline='') as f:
+                assert f.read().splitlines() == ["id,name,extra", "1,A,", "2,,True"]
+            
+            # Without fixed headers the file is loaded, keeping every column
+            converter.convert_to_csv(data=json_file, output_file=csv_file)
+            with open(csv_file, 'r', newline='') as f:
+                lines = f.read().splitlines()
+            assert lines == ["extra,id,name", ",1,A", "True,2,"]
+        finally:
+            for path in (json_file, csv_file):
+                if os.path.exists(path):
+                    os.remove(path)
+            os.rmdir(output_dir)
+    
+    def test_streaming_error_leaves_no_output(self):
+        """Test a failed streamed conversion leaves no partial CSV behind."""
+        pytest.importorskip("ijson")
+        converter = JSONConverter(stream_threshold=0, strict_mode=True)
+        data = [{"a": 1}, {"a": 2}, {"b": 3}]
+        output_dir = tempfile.mkdtemp()
+        json_file = os.path.join(output_dir, "data.json")
+        csv_file = os.path.join(output_dir, "data.csv")
+        
+        try:
+            with open(json_file, 'w') as f:
+                json.dump(data, f)
+            
+            with pytest.raises(ConversionError, match="different keys"):
+                converter.convert_to_csv(
+                    data=json_file,
+                    output_file=csv_file,
+                    flatten_nested=False
+                )
+            
+            assert os.listdir(output_dir) == ["data.json"]
+        finally:
+            for path in (json_file, csv_file):
+                if os.path.exists(path):
+                    os.remove(path)
+            os.rmdir(output_dir)
+    
+    def test_convert_stream_strict_nested(self):
+        """Test streaming strict mode checks raw keys, not flattened ones."""
+        pytest.importorskip("ijson")
+        converter = JSONConverter(strict_mode=True)
+        data = [
+            {"id": 1, "info": {"name": "J"}},
+            {"id": 2, "info": {"city": "N"}}
+        ]
+        output_dir = tempfile.mkdtemp()
+        json_file = os.path.join(output_dir, "data.json")
+        csv_file = os.path.join(output_dir, "data.csv")
+        
+        try:
+            with open(json_file, 'w') as f:
+                json.dump(data, f)
+            
+            with pytest.warns(UserWarning, match="different keys"):
+                converter.convert_stream(
+                    input_file=json_file,
+                    output_file=csv_file
+                )
+            assert os.path.exists(csv_file)
+        finally:
+            for path in (json_file, csv_file):
+                if os.path.exists(path):
+                    os.remove(path)
+            os.rmdir(output_dir)
+    
+    def test_convert_stream_big_integers(self, converter):
+        """Test streaming falls back for integers ijson cannot parse."""
+        pytest.importorskip("ijson")
+        output_dir = tempfile.mkdtemp()
+        json_file = os.path.join(output_dir, "data.json")
+        csv_file = os.path.join(output_dir, "data.csv")
+        
+        try:
+            with open(json_file, 'w') as f:
+                json.dump([{"id": 2 ** 64 + 5}], f)
+            
+            converter.convert_stream(input_file=json_file, output_file=csv_file)
+            
+            with open(csv_file, 'r', newline='') as f:
+                assert f.read().splitlines() == ["id", "18446744073709551621"]
+        finally:
+            for path in (json_file, csv_file):
+                if os.path.exists(path):
+                    os.remove(path)
+            os.rmdir(output_dir)
+    
+    def test_strict_mode_nested_rows(self):
+        """Test strict mode with nested rows whose flattened keys differ."""
+        converter = JSONConverter(strict_mode=True)
+        data = [
+            {"id": 1, "info": {"name": "John"}},
+            {"id": 2, "info": {"city": "NYC"}}
+        ]
+        
+        result = converter.convert_to_csv(data=data)
+        assert result.splitlines() == [
+            "id,info.city,info.name",
+            "1,,John",
+            "2,NYC,"
+        ]
+    
+    def test_strict_mode_revalidates_mutated_data(self):
+        """Test strict validation runs again after the data changes."""
+        converter = JSONConverter(strict_mode=True)
+        data = [{"a": 1}, {"a": 2}]
+        converter.convert_to_csv(data=data, flatten_nested=False)
+        
+        data[1]["b"] = 5
+        
+        with pytest.raises(ConversionError, match="different keys"):
+            converter.convert_to_csv(data=data, flatten_nested=False)
+    
+    def test_strict_mode_flat_rows_changed_keys(self):
+        """Test strict mode rejects flat rows whose key set changed."""
+        converter = JSONConverter(strict_mode=True)
+        data = [{"a": 1}, {"a": 2}]
+        assert converter.convert_to_csv(data=data) == "a\r\n1\r\n2\r\n"
+        
+        data[1] = {"b": 9}
+        
+        with pytest.raises(ConversionError, match="different keys"):
+            converter.convert_to_csv(data=data)
+    
     def test_validation_enabled(self):
         """Test with validation enabled."""
         converter = JSONConverter(validate=True)
@@ -257,6 +690,17 @@ class TestEdgeCases:
         result = converter.convert_to_csv(data=data)
         assert result is not None
     
+    def test_headers_from_mixed_keys(self):
+        """Test headers cover the union of keys when rows differ."""
+        converter = JSONConverter(validate=False)
+        data = [
+            {"name": "John", "age": 30},
+            {"city": "NYC", "name": "Jane"}
+        ]
+        
+        result = converter.convert_to_csv(data=data)
+        assert result.splitlines()[0] == "age,city,name"
+    
     def test_none_values(self):
         """Test handling of None values."""
         converter = JSONConverter()
@@ -278,6 +722,12 @@ class TestEdgeCases:
         
         result = converter.convert_to_csv(data=data)
         assert result is not None
+        
+        rows = list(csv.reader(io.StringIO(result)))
+        assert rows[1:] == [
+            ["Quote\"test", "John,Doe"],
+            ["Tab\ttest", "Jane\nSmith"]
+        ]
     
     def test_large_dataset(self):
         """Test with large dataset."""
@@ -1,6 +1,7 @@
 """Tests for utility functions."""
 
 import pytest
+from collections import OrderedDict
 from ArcoJson.utils import flatten_json, detect_delimiter
 
 
@@ -86,6 +87,25 @@ class TestFlattenJSON:
         # Should stop flattening at depth 2
         assert "level1.level2" in result
     
+    def test_key_order_preserved(self):
+        """Test flattened keys keep their original order."""
+        data = {"b": {"y": 1, "x": 2}, "a": 3}
+        
+        result = flatten_json(data)
+        
+        assert list(result) == ["b.y", "b.x", "a"]
+    
+    def test_dict_and_list_subclasses(self):
+        """Test nested dict and list subclasses are flattened too."""
+        class Tags(list):
+            pass
+        
+        data = {"user": OrderedDict(name="John", tags=Tags(["a"]))}
+        
+        result = flatten_json(data)
+        
+        assert result == {"user.name": "John", "user.tags": "['a']"}
+    
     def test_empty_dict(self):
         """Test flattening empty dictionary."""
         result = flatten_json({})
@@ -137,6 +157,13 @@ class TestDetectDelimiter:
         
         assert result == ':'
     
+    def test_tie_prefers_first_candidate(self):
+        """Test that ties resolve to the earliest candidate."""
+        sample = "a;b,c"
+        result = detect_delimiter(sample=sample)
+        
+        assert result == ','
+    
     def test_empty_sample(self):
         """Test with empty sample."""
         result = detect_delimiter(sample="")
@@ -62,4 +62,24 @@ class TestDataValidator:
             {"name": "John", "age": 30},
             {"name": "Jane", "city": "NYC"}  # Different keys
         ]
-        
\ No newline at end of file
+    
+    def test_revalidation_after_append(self, validator):
+        """Test a validated list is checked again after it changes."""
+        data = [{"name": "John"}, {"name": "Jane"}]
+        assert validator.validate_data(data=data) is True
+        
+        data.append("not a dict")
+        
+        with pytest.raises(ValidationError, match="must be dictionaries"):
+            validator.validate_data(data=data)
+    
+    def test_strict_after_non_strict(self, validator):
+        """Test strict validation is not skipped after a non-strict pass."""
+        data = [
+            {"name": "John", "age": 30},
+            {"name": "Jane", "city": "NYC"}
+        ]
+        assert validator.validate_data(data=data) is True
+        
+        with pytest.raises(ValidationError, match="different keys"):
+            validator.validate_data(data=data, strict=True)